@@ -1,4 +1,5 @@
 from __future__ import annotations
+from PyQt6.QtCore import QObject, pyqtSlot
 from PyQt6.QtWidgets import (QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
                              QProgressBar, QGroupBox, QFormLayout)
 
@@ -43,6 +44,8 @@ class SimulationConfig:
         "simulation": ["duration_time", "dx", "dt"],
         "export": ["export_ith_image", "video_duration"],
     }
+    # inverted lookup: parameter key -> category group it belongs to
+    PARAM_TO_GROUP = {param: group for group, params in CATEGORY_GROUPS.items() for param in params}
     COLOR_CODES = {
         "red": "#D32F2F",
         "green": "#66BB6A",
@@ -58,6 +61,9 @@ class SimulationConfig:
     def get_category_group_params(self, key) -> list:
         return self.CATEGORY_GROUPS[key]
 
+    def get_param_group(self, key) -> str:
+        return self.PARAM_TO_GROUP[key]
+
     def get_color_code(self, color) -> str:
         return self.COLOR_CODES[color]
 
@@ -69,6 +75,8 @@ class QuantumTunnellingAppUI(QWidget):
         self.setWindowTitle("Quantum Tunneling Simulation")
         self.layout = QVBoxLayout()
         self.entries = {}
+        self._params_cache = None  # invalidated whenever an entry changes
+        self._stylesheets = self._build_progress_bar_stylesheets()
 
         self._initialize_entries()
         self._initialize_start_button()
@@ -95,8 +103,7 @@ class QuantumTunnellingAppUI(QWidget):
 
         # Add entries to group layouts from config.PARAMETERS
         for item in self.config.PARAMETERS:
-            for group_key in group_keys:
-                self._add_entry_row_in_group_layout(item, group_key)
+            self._add_entry_row_in_group_layout(item)
 
         # Add groups to the main layout
         for group_key in group_keys:
@@ -129,47 +136,63 @@ class QuantumTunnellingAppUI(QWidget):
         self.export_button = QPushButton("Export Video")
         self.layout.addWidget(self.export_button)
 
-    def _add_entry_row_in_group_layout(self, item, group_key):
+    def _add_entry_row_in_group_layout(self, item):
         """
-        Adds entry row in entry group.
+        Adds entry row in the entry group the parameter belongs to.
         :param item: Item from GUI parameters from SimulationConfig class.
-        :param group_key:
         :return:
         """
         label, key = item
         default_value = str(self.config.get_default_value(key))
         entry = self._create_entry(key, default_value)
-        if key in self.config.get_category_group_params(group_key):
-            self.group_layouts[group_key].addRow(QLabel(label), entry)
+        group_key = self.config.get_param_group(key)
+        self.group_layouts[group_key].addRow(QLabel(label), entry)
 
     def _create_entry(self, key, default_value):
         entry = QLineEdit()
         entry.setText(default_value)
+        entry.textChanged.connect(self._invalidate_params_cache)
         self.entries[key] = entry
         return entry
 
-    def get_parameter_values(self):
-        params = {key: float(entry_object.text()) for key, entry_object in self.entries.items()}
-        params["export_ith_image"] = int(params["export_ith_image"])
-        return params
+    def _invalidate_params_cache(self) -> None:
+        self._params_cache = None
 
+    def get_parameter_values(self):
+        if self._params_cache is None:
+            params = {key: float(entry_object.text()) for key, entry_object in self.entries.items()}
+            params["export_ith_image"] = int(params["export_ith_image"])
+            self._params_cache = params
+        return self._params_cache
 
-    def set_progress_bar_color(self, color):
-        self.progress_bar.setStyleSheet(f"""
+    def _build_progress_bar_stylesheets(self) -> dict:
+        """
+        Precompiles one progress bar stylesheet per configured color, so color changes
+        do not rebuild and re-parse the stylesheet string.
+        :return: Dictionary mapping color name to stylesheet string.
+        """
+        return {
+            color: f"""
             QProgressBar {{
                 border-radius: 6px;  /* Rounded corners */
                 background-color: #e6e6e6;  /* Light gray background color for the unfilled portion */
                 height: 5px;  /* Reduce the height of the progress bar */
             }}
             QProgressBar::chunk {{
-                background-color: {self.config.get_color_code(color)};  /* Red color for the filled portion */
+                background-color: {code};  /* Color for the filled portion */
                 border-radius: 6px;  /* Rounded corners for the chunk to match the overall style */
             }}
-        """)
+        """
+            for color, code in self.config.COLOR_CODES.items()
+        }
 
-class QuantumTunnellingApp:
+    def set_progress_bar_color(self, color):
+        self.progress_bar.setStyleSheet(self._stylesheets[color])
+
+class QuantumTunnellingApp(QObject):
     # noinspection PyUnresolvedReferences
     def __init__(self):
+        super().__init__()
         self.simulation_worker = None  # Track simulation thread
         self.video_worker = None  # Track simulation thread
         self.UI = QuantumTunnellingAppUI()
@@ -211,14 +234,30 @@ class QuantumTunnellingApp:
         self.simulation_worker = SimulationWorker(calc, params["export_ith_image"])
 
         # Connect simulation worker progress information to GUI visualisation
-        self.simulation_worker.progress.connect(self.UI.progress_bar.setValue)
-        self.simulation_worker.finished.connect(lambda: self.UI.start_button.setText("Start Simulation"))
-        self.simulation_worker.finished.connect(lambda: self.UI.set_progress_bar_color("green"))
-        self.simulation_worker.interrupted.connect(lambda: self.UI.set_progress_bar_color("red"))
+        self.simulation_worker.progress.connect(self._on_progress)
+        self.simulation_worker.finished.connect(self._on_simulation_finished)
+        self.simulation_worker.interrupted.connect(self._on_simulation_interrupted)
 
         # Start simulation worker
         self.simulation_worker.start()
 
+    @pyqtSlot(int)
+    def _on_progress(self, value: int) -> None:
+        self.UI.progress_bar.setValue(value)
+
+    @pyqtSlot()
+    def _on_simulation_finished(self) -> None:
+        self.UI.start_button.setText("Start Simulation")
+        self.UI.set_progress_bar_color("green")
+
+    @pyqtSlot()
+    def _on_simulation_interrupted(self) -> None:
+        self.UI.set_progress_bar_color("red")
+
+    @pyqtSlot()
+    def _on_video_finished(self) -> None:
+        self.UI.set_progress_bar_color("green")
+
 
     def toggle_simulation(self) -> None:
         if self.simulation_worker and self.simulation_worker.isRunning():  # If simulation is running, stop it
@@ -244,8 +283,8 @@ class QuantumTunnellingApp:
             image_folder=image_path,
             fps=fps
         )
-        self.video_worker.progress.connect(self.UI.progress_bar.setValue)
-        self.video_worker.finished.connect(lambda: self.UI.set_progress_bar_color("green"))
+        self.video_worker.progress.connect(self._on_progress)
+        self.video_worker.finished.connect(self._on_video_finished)
         self.video_worker.start()
 
 # if __name__ == "__main__":
@@ -1,10 +1,31 @@
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QRunnable, QThread, QThreadPool, pyqtSignal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import glob
 import os
+import shutil
 import cv2
 
 from src.visualization import Visualization
 
 
+class FrameRenderRunnable(QRunnable):
+    """
+    Renders one exported frame on a pool thread, so plotting and PNG encoding
+    do not stall the physics loop in SimulationWorker.run.
+    """
+
+    def __init__(self, vis, packet, time_step_index):
+        super().__init__()
+        self.setAutoDelete(True)
+        self.vis = vis
+        self.packet = packet
+        self.time_step_index = time_step_index
+
+    def run(self):
+        self.vis.plot_wave_packet(self.packet, self.time_step_index)
+
+
 class SimulationWorker(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
@@ -17,39 +38,61 @@ class SimulationWorker(QThread):
         self.vis = Visualization(calc)
         self.running = True
         self.export_ith_image = export_ith_image
+        self._last_pct = -1
+        self.render_pool = QThreadPool.globalInstance()
+        self.render_pool.setMaxThreadCount(os.cpu_count())
         self._initialize_image_folder()
 
     def _initialize_image_folder(self) -> None:
         """
         Deletes all files from previous runs. Ensures the image folder exists.
         """
+        # removing the whole tree is one bulk operation instead of a syscall per frame
         image_folder = self.vis.image_folder
-        if os.path.exists(image_folder):
-            for file in os.listdir(image_folder[:-1]):
-                file_object_path = os.path.join(image_folder, file)
-                os.remove(file_object_path)
+        if os.path.isdir(image_folder):
+            shutil.rmtree(image_folder)
         os.makedirs(image_folder, exist_ok=True)
 
     def _emit_progress(self, i, t_steps) -> None:
-        """ Emits progress as a percentage. """
-        self.progress.emit(int(i / t_steps * 100))
+        """ Emits progress as a percentage, only when the integer percent changes. """
+        pct = i * 100 // t_steps
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress.emit(pct)
+
+    def _render_frame(self, i) -> None:
+        """
+        Hands a snapshot of the packet to the render pool. The copy decouples the
+        frame from the packet array, which the next timestep mutates in place.
+        """
+        self.render_pool.start(FrameRenderRunnable(self.vis, self.calc.get_packet().copy(), i))
 
     # noinspection PyUnresolvedReferences
     def run(self):
-        self.vis.plot_wave_packet(self.calc.get_packet(), 0)
+        self._render_frame(0)
         t_steps = self.calc.division_time
 
+        # bind hot-loop lookups to locals - the loop runs tens of thousands of times
+        # (self.running stays an attribute read; it is flipped from another thread)
+        step = self.calc.calculate_timestep
+        every = self.export_ith_image
+        render_frame = self._render_frame
+        emit_progress = self._emit_progress
+
         for i in range(1, t_steps + 1):
             if not self.running:
                 break  # Stop simulation if needed
 
-            self.calc.calculate_timestep()
+            step()
 
             # plot only every i-th image
-            if i % self.export_ith_image == 0:
-                self.vis.plot_wave_packet(self.calc.get_packet(), i)
+            if i % every == 0:
+                render_frame(i)
+
+            emit_progress(i, t_steps)
 
-            self._emit_progress(i, t_steps)
+        # wait for outstanding frame renders so every exported PNG exists on finish
+        self.render_pool.waitForDone()
 
         if self.running:
             self.finished.emit()
@@ -67,15 +110,16 @@ class ExportVideoWorker(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
     video_name = "tunnelling_video.mp4"
+    DECODE_AHEAD = 32  # maximum number of decoded frames held in memory
 
     def __init__(self, image_folder, fps):
         super().__init__()
         self.image_folder = image_folder
-        self.image_names = sorted(
-            [f for f in os.listdir(self.image_folder) if
-             f.startswith("frame_") and f.split('_')[1].split('.')[0].isdigit()],
-            key=lambda x: int(x.split('_')[1].split('.')[0])
-        )
+        # compute the numeric sort key once per file instead of twice per comparison
+        names = [os.path.basename(p)
+                 for p in glob.iglob(os.path.join(self.image_folder, 'frame_[0-9]*.png'))]
+        keys = [int(name[6:-4]) for name in names]
+        self.image_names = [name for _, name in sorted(zip(keys, names))]
         self.image_number = len(self.image_names)
         self._initialize_video_writer(fps)
 
@@ -92,13 +136,35 @@ class ExportVideoWorker(QThread):
         self.video = cv2.VideoWriter(self.video_name, fourcc, fps, (width, height))
 
     def _create_video(self):
-        """Creates a video from stored frames."""
-        for i, image in enumerate(self.image_names):
-            self.video.write(cv2.imread(os.path.join(self.image_folder, image)))
-            self.progress.emit(int(i / self.image_number * 100))
+        """Creates a video from stored frames, decoding PNGs ahead of the writer."""
+        pending = deque()
+        written = 0
+        # cv2.imread releases the GIL, so a small pool overlaps PNG decoding with
+        # the sequential VideoWriter.write calls; the deque bounds how many decoded
+        # frames are held in memory at once
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count())) as pool:
+            # bind per-frame lookups to locals
+            submit = pool.submit
+            imread = cv2.imread
+            join = os.path.join
+            folder = self.image_folder
+            enqueue = pending.append
+            for image in self.image_names:
+                enqueue(submit(imread, join(folder, image)))
+                if len(pending) >= self.DECODE_AHEAD:
+                    written = self._write_next_frame(pending, written)
+            while pending:
+                written = self._write_next_frame(pending, written)
         self.video.release()
         self.progress.emit(100)  # Ensure progress reaches 100
 
+    def _write_next_frame(self, pending, written) -> int:
+        """Writes the oldest decoded frame to the video and emits progress."""
+        self.video.write(pending.popleft().result())
+        written += 1
+        self.progress.emit(written * 100 // self.image_number)
+        return written
+
     # noinspection PyUnresolvedReferences
     def run(self):
         self._create_video()